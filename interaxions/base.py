@@ -14,14 +14,40 @@ Two classes are provided:
 """
 
 from abc import ABC
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Type, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type, TypeVar, Union
 
 import yaml
 
-from jinja2 import Template
 from pydantic import BaseModel
 
+if TYPE_CHECKING:
+    from jinja2 import Template
+
+# Use libyaml's C parser when PyYAML was built with it; same safe semantics.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# jinja2 is only needed by BaseRepo.render_template; import it on first use
+# so that loading configs and schemas does not pay for it.
+_Template: Optional[Type["Template"]] = None
+
+
+def _get_template_cls() -> Type["Template"]:
+    """Return jinja2.Template, importing jinja2 on the first call only."""
+    global _Template
+    if _Template is None:
+        from jinja2 import Template
+        _Template = Template
+    return _Template
+
+
+@lru_cache(maxsize=128)
+def _compile_template(source: str) -> "Template":
+    """Compile a Jinja2 template source, reusing the result for repeated sources."""
+    return _get_template_cls()(source)
+
+
 # ---------------------------------------------------------------------------
 # Config base
 # ---------------------------------------------------------------------------
@@ -58,14 +84,15 @@ class BaseRepoConfig(BaseModel):
             FileNotFoundError: If neither config.yaml nor config.yml exists.
             ValueError: If the file is empty or does not parse to a dict.
         """
-        config_file = Path(repo_name_or_path) / "config.yaml"
+        repo_path = Path(repo_name_or_path)
+        config_file = repo_path / "config.yaml"
         if not config_file.exists():
-            config_file = Path(repo_name_or_path) / "config.yml"
+            config_file = repo_path / "config.yml"
         if not config_file.exists():
             raise FileNotFoundError(f"Config file not found in {repo_name_or_path}. "
                                     "Expected 'config.yaml' or 'config.yml'.")
         with open(config_file, "r", encoding="utf-8") as f:
-            config_dict = yaml.safe_load(f)
+            config_dict = yaml.load(f, Loader=_YamlLoader)
         if not isinstance(config_dict, dict):
             raise ValueError(f"Invalid config file: {config_file}. Expected a YAML mapping, "
                              f"got {type(config_dict).__name__}.")
@@ -94,12 +121,13 @@ class BaseRepoConfig(BaseModel):
         if "templates" not in config_dict or not isinstance(config_dict["templates"], dict):
             return config_dict
 
+        repo_path = Path(repo_name_or_path)
         loaded: Dict[str, str] = {}
         for name, path in config_dict["templates"].items():
             if not isinstance(path, str):
                 raise ValueError(f"Template '{name}' must be a file path string, "
                                  f"got {type(path).__name__}.")
-            template_file = Path(repo_name_or_path) / path
+            template_file = repo_path / path
             if not template_file.exists():
                 raise FileNotFoundError(f"Template file not found: {template_file}\n"
                                         f"Template '{name}' references '{path}' which does not exist.")
@@ -222,11 +250,13 @@ class BaseRepo(ABC):
                 "problem_statement": environment.data["problem_statement"],
             })
         """
-        if not hasattr(self.config, "templates") or not self.config.templates:
+        templates = getattr(self.config, "templates", None)
+        if not templates:
             raise ValueError(f"No templates found in {type(self).__name__} config. "
                              "The object must be loaded via from_repo() to use templates.")
-        if template_name not in self.config.templates:
-            available = list(self.config.templates.keys())
+        source = templates.get(template_name)
+        if source is None:
+            available = list(templates.keys())
             raise ValueError(f"Template '{template_name}' not found in {type(self).__name__} config. "
                              f"Available templates: {available}")
-        return Template(self.config.templates[template_name]).render(context)
+        return _compile_template(source).render(context)
@@ -108,6 +108,10 @@ class _AutoBase:
         """Load an instance from a remote or local repository via hub_manager."""
         hub_manager = get_hub_manager()
 
+        # Resolve revision=None to a commit hash once, so get_module_path and
+        # load_module below do not each repeat the git lookups
+        revision = hub_manager.resolve_revision(repo_name_or_path, revision, username, token)
+
         # Download/locate the repository
         module_path = hub_manager.get_module_path(
             repo_name_or_path,
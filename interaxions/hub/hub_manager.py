@@ -32,6 +32,9 @@ from interaxions.hub.constants import get_hub_cache_dir
 
 logger = logging.getLogger(__name__)
 
+# Protocols accepted in IX_ENDPOINT when embedding credentials into a Git URL
+_GIT_URL_PROTOCOLS = frozenset({"http", "https"})
+
 
 class HubManager:
     """
@@ -254,15 +257,11 @@ class HubManager:
 
         # Construct URL with optional authentication
         if username and token:
-            # Extract protocol and host from base_url
-            if base_url.startswith("http://"):
-                protocol = "http"
-                host = base_url[7:]  # Remove "http://"
-            elif base_url.startswith("https://"):
-                protocol = "https"
-                host = base_url[8:]  # Remove "https://"
-            else:
-                # Assume https if no protocol specified
+            # Extract protocol and host from base_url in a single split
+            protocol, sep, host = base_url.partition("://")
+            protocol = protocol.lower()  # URL schemes are case-insensitive
+            if not sep or protocol not in _GIT_URL_PROTOCOLS:
+                # Assume https if no (supported) protocol specified
                 protocol = "https"
                 host = base_url
 
@@ -575,6 +574,46 @@ class HubManager:
             raise RuntimeError(f"Failed to checkout revision '{revision}' from {source_path}:\n"
                                f"Error: {e.stderr if hasattr(e, 'stderr') else str(e)}")
 
+    def resolve_revision(
+        self,
+        repo_name_or_path: str,
+        revision: Optional[str] = None,
+        username: Optional[str] = None,
+        token: Optional[str] = None,
+    ) -> str:
+        """
+        Resolve a revision to the one that will actually be loaded.
+
+        Pinned revisions are returned unchanged. When revision is None, the
+        repository is located (cloning or fetching remote repositories) and its
+        local HEAD commit hash is returned. Callers that go on to make several
+        hub calls for the same load should resolve once and pass the result on,
+        so the git lookups are not repeated.
+
+        Args:
+            repo_name_or_path: Repository name or path (e.g., "ix-hub/swe-agent").
+            revision: Git revision (tag, branch, or commit hash), or None for latest.
+            username: Username for private repository authentication
+            token: Token/password for private repository authentication
+
+        Returns:
+            The pinned revision, or the local HEAD commit hash.
+        """
+        if revision is not None:
+            return revision
+
+        # First resolve the repo path (this will clone from remote if not exists locally)
+        source_path = self._resolve_repo_path(repo_name_or_path, username, token)
+
+        # Now that we have a local path, always use local HEAD commit hash
+        # This works for:
+        # - Original local repositories
+        # - Remote repositories cloned to local
+        # - All detect local changes/new commits
+        revision = self._get_local_commit_hash(source_path)
+        logger.info(f"Resolved to local commit hash: {revision}")
+        return revision
+
     def get_module_path(
         self,
         repo_name_or_path: str,
@@ -614,19 +653,7 @@ class HubManager:
         Returns:
             Path to the cached module directory.
         """
-        # If revision is None, resolve to latest commit hash from local HEAD
-        if revision is None:
-            # First resolve the repo path (this will clone from remote if not exists locally)
-            source_path = self._resolve_repo_path(repo_name_or_path, username, token)
-
-            # Now that we have a local path, always use local HEAD commit hash
-            # This works for:
-            # - Original local repositories
-            # - Remote repositories cloned to local
-            # - All detect local changes/new commits
-            revision = self._get_local_commit_hash(source_path)
-            logger.info(f"Resolved to local commit hash: {revision}")
-
+        revision = self.resolve_revision(repo_name_or_path, revision, username, token)
         cached_path = self._get_cached_path(repo_name_or_path, revision)
 
         # Fast path: check if already cached (no lock needed for read)
@@ -11,6 +11,8 @@ from interaxions.schemas.models import (
     OpenAIModel,
     AnthropicModel,
     LiteLLMModel,
+    validate_model,
+    dump_model,
 )
 from interaxions.schemas.scaffold import ScaffoldConfig
 from interaxions.schemas.environment import EnvironmentConfig
@@ -24,6 +26,8 @@ __all__ = [
     "OpenAIModel",
     "AnthropicModel",
     "LiteLLMModel",
+    "validate_model",
+    "dump_model",
     # XJob
     "XJob",
     # Component config schemas (standard vocabulary for workflow params)
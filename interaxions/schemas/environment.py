@@ -1,6 +1,6 @@
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class EnvironmentConfig(BaseModel):
@@ -30,3 +30,5 @@ class EnvironmentConfig(BaseModel):
     token: Optional[str] = Field(None, description="Token/password for private repository authentication")
     id: str = Field(..., description="Environment instance identifier (e.g., 'django__django-12345')")
     params: Dict[str, Any] = Field(default_factory=dict, description="Environment-specific parameters passed to create_task()")
+
+    model_config = ConfigDict(frozen=True, defer_build=True)
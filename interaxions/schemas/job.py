@@ -1,11 +1,17 @@
+from os import urandom
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from interaxions.schemas.workflow import WorkflowConfig
 from interaxions.schemas.runtime import RuntimeConfig
 
 
+def _new_job_id() -> str:
+    """Return a fresh job identifier: ``job-`` followed by 32 random hex characters."""
+    return f"job-{urandom(16).hex()}"
+
+
 class XJob(BaseModel):
     """
     A job is a unit of work that can be executed.
@@ -53,6 +59,15 @@ class XJob(BaseModel):
         ...     runtime=RuntimeConfig(namespace="experiments")
         ... )
 
+    Immutability:
+        XJob and its configs (WorkflowConfig, RuntimeConfig, ScaffoldConfig,
+        EnvironmentConfig) are frozen: assigning to a field raises a
+        ValidationError. Derive a changed job with model_copy instead.
+        Unknown top-level fields are rejected; put job-level extras in
+        extra_params and open-ended runtime settings in runtime.extra_params.
+
+        >>> renamed = job.model_copy(update={"name": "swe-bench-django-12345-retry"})
+
     Persistence:
         >>> # Save job configuration
         >>> with open("job.json", "w") as f:
@@ -77,10 +92,36 @@ class XJob(BaseModel):
     # === Extra ===
     extra_params: Optional[Dict[str, Any]] = Field(None, description="Additional job-level parameters")
 
-    @model_validator(mode='after')
-    def generate_job_id(self):
-        """Auto-generate job_id if not provided."""
-        if self.job_id is None:
-            import uuid
-            self.job_id = f"job-{uuid.uuid4()}"
-        return self
+    model_config = ConfigDict(frozen=True, extra="forbid", defer_build=True)
+
+    @model_validator(mode="before")
+    @classmethod
+    def generate_job_id(cls, data: Any) -> Any:
+        """Auto-generate job_id if not provided.
+
+        Filled in before field validation so the generated id counts as set and
+        survives ``model_dump(exclude_unset=True)``.
+        """
+        if isinstance(data, dict) and data.get("job_id") is None:
+            return {**data, "job_id": _new_job_id()}
+        return data
+
+    @classmethod
+    def new_fast(cls, **data: Any) -> "XJob":
+        """
+        Build an XJob from trusted inputs without running validation.
+
+        Use this only when the inputs are known to be valid, e.g. jobs stamped
+        out in a loop from an already-validated template. ``workflow`` and
+        ``runtime`` must be WorkflowConfig/RuntimeConfig instances; nested
+        dicts are not converted. A job_id is generated when none is given.
+
+        Example:
+            >>> jobs = [
+            ...     XJob.new_fast(name=f"sweep-{i}", workflow=template.workflow, runtime=template.runtime)
+            ...     for i in range(1000)
+            ... ]
+        """
+        if data.get("job_id") is None:
+            data["job_id"] = _new_job_id()
+        return cls.model_construct(**data)
@@ -4,7 +4,7 @@ Model configurations for agents.
 
 from typing import Annotated, Any, Dict, Literal, Optional, Union
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class OpenAIModel(BaseModel):
@@ -24,7 +24,7 @@ class OpenAIModel(BaseModel):
     num_retries: int = Field(default=3, ge=0, description="The number of retries")
     temperature: Optional[float] = Field(default=None, ge=0.0, le=2.0, description="The temperature")
     max_tokens: Optional[int] = Field(default=None, ge=1, description="The maximum number of tokens to generate")
-    completion_kwargs: Optional[Dict[str, Any]] = Field(default={}, description="The completion kwargs")
+    completion_kwargs: Optional[Dict[str, Any]] = Field(default_factory=dict, description="The completion kwargs")
 
     model_config = ConfigDict(extra="forbid")
 
@@ -46,7 +46,7 @@ class AnthropicModel(BaseModel):
     num_retries: int = Field(default=3, ge=0, description="The number of retries")
     temperature: Optional[float] = Field(default=None, ge=0.0, le=1.0, description="The temperature")
     max_tokens: Optional[int] = Field(default=None, ge=1, description="The maximum number of tokens to generate")
-    completion_kwargs: Optional[Dict[str, Any]] = Field(default={}, description="The completion kwargs")
+    completion_kwargs: Optional[Dict[str, Any]] = Field(default_factory=dict, description="The completion kwargs")
 
     model_config = ConfigDict(extra="forbid")
 
@@ -68,7 +68,7 @@ class LiteLLMModel(BaseModel):
 
     num_retries: int = Field(default=3, ge=0, description="The number of retries")
     temperature: Optional[float] = Field(default=None, ge=0.0, le=1.0, description="The temperature")
-    completion_kwargs: Optional[Dict[str, Any]] = Field(default={}, description="The completion kwargs")
+    completion_kwargs: Optional[Dict[str, Any]] = Field(default_factory=dict, description="The completion kwargs")
 
     model_config = ConfigDict(extra="forbid")
 
@@ -78,3 +78,26 @@ Model = Annotated[Union[
     AnthropicModel,
     LiteLLMModel,
 ], Field(discriminator="type")]
+
+# Built once at import so every dict -> Model conversion reuses the compiled
+# discriminated-union validator instead of building a new TypeAdapter.
+_MODEL_ADAPTER: "TypeAdapter[Model]" = TypeAdapter(Model)
+
+
+def validate_model(data: Any) -> Union[OpenAIModel, AnthropicModel, LiteLLMModel]:
+    """
+    Validate a raw model configuration into the matching Model class.
+
+    The concrete class is selected by the ``type`` discriminator, e.g. a
+    ``workflow.params["model"]`` dict with ``type: litellm`` becomes a
+    LiteLLMModel.
+
+    Raises:
+        pydantic.ValidationError: If the data does not match any model type.
+    """
+    return _MODEL_ADAPTER.validate_python(data)
+
+
+def dump_model(model: Union[OpenAIModel, AnthropicModel, LiteLLMModel]) -> Dict[str, Any]:
+    """Serialize a Model instance to a plain dict (inverse of validate_model)."""
+    return _MODEL_ADAPTER.dump_python(model)
@@ -1,6 +1,6 @@
 from typing import Any, Dict, Literal, Union, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Resources(BaseModel):
@@ -23,6 +23,9 @@ class RuntimeConfig(BaseModel):
     Runtime configuration schema.
     
     Defines Kubernetes/Argo Workflows runtime settings.
+
+    The model is frozen and rejects unknown fields. Settings without a
+    dedicated field (labels, node_selector, tolerations, ...) go in extra_params.
     
     Example:
         >>> from interaxions.schemas import RuntimeConfig
@@ -46,3 +49,5 @@ class RuntimeConfig(BaseModel):
     active_deadline_seconds: Optional[int] = Field(None, description="Active deadline seconds")
     ttl_seconds_after_finished: Optional[int] = Field(None, description="TTL (seconds) for workflow cleanup after completion")
     extra_params: Dict[str, Any] = Field(default_factory=dict, description="Additional runtime parameters (e.g., labels, annotations, node_selector, tolerations, priority_class_name)")
+
+    model_config = ConfigDict(frozen=True, extra="forbid", defer_build=True)
@@ -1,6 +1,6 @@
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ScaffoldConfig(BaseModel):
@@ -27,3 +27,5 @@ class ScaffoldConfig(BaseModel):
     username: Optional[str] = Field(None, description="Username for private repository authentication")
     token: Optional[str] = Field(None, description="Token/password for private repository authentication")
     params: Dict[str, Any] = Field(default_factory=dict, description="Scaffold-specific parameters passed to create_task()")
+
+    model_config = ConfigDict(frozen=True, defer_build=True)
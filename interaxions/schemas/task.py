@@ -1,6 +1,6 @@
 from typing import Any, Dict
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Environment(BaseModel):
@@ -34,3 +34,4 @@ class Environment(BaseModel):
     type: str = Field(..., description="Environment type, matches repo config.yaml type field")
     data: Dict[str, Any] = Field(default_factory=dict, description="Instance-specific data loaded from the data source")
 
+    model_config = ConfigDict(defer_build=True)
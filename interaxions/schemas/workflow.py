@@ -1,6 +1,6 @@
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class WorkflowConfig(BaseModel):
@@ -43,3 +43,5 @@ class WorkflowConfig(BaseModel):
     username: Optional[str] = Field(None, description="Username for private repository authentication")
     token: Optional[str] = Field(None, description="Token/password for private repository authentication")
     params: Dict[str, Any] = Field(default_factory=dict, description="Workflow-specific parameters. The workflow defines and validates its own params schema.")
+
+    model_config = ConfigDict(frozen=True, defer_build=True)
@@ -3,9 +3,13 @@ Pytest configuration and shared fixtures for all tests.
 """
 
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
+from interaxions import AutoEnvironment, AutoScaffold, AutoWorkflow
+from interaxions.hub import AutoTask
+from interaxions.hub.hub_manager import HubManager
 from interaxions.schemas import (
     EnvironmentConfig,
     RuntimeConfig,
@@ -20,60 +24,117 @@ from interaxions.schemas import (
 # ============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def project_root() -> Path:
     """Return the project root directory."""
     return Path(__file__).parent.parent
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def tests_dir(project_root: Path) -> Path:
     """Return the tests directory."""
     return project_root / "tests"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fixtures_dir(tests_dir: Path) -> Path:
     """Return the fixtures directory."""
     return tests_dir / "fixtures"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_repos_dir(fixtures_dir: Path) -> Path:
     """Return the mock repositories directory."""
     return fixtures_dir / "mock_repos"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_scaffold_repo(mock_repos_dir: Path) -> Path:
     """Return the test-scaffold mock repo path."""
     return mock_repos_dir / "test-scaffold"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_workflow_repo(mock_repos_dir: Path) -> Path:
     """Return the test-workflow mock repo path."""
     return mock_repos_dir / "test-workflow"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_environment_repo(mock_repos_dir: Path) -> Path:
     """Return the test-environment mock repo path."""
     return mock_repos_dir / "test-environment"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_task_repo(mock_repos_dir: Path) -> Path:
     """Return the test-task mock repo path."""
     return mock_repos_dir / "test-task"
 
 
+# ============================================================================
+# Hub Fixtures
+# ============================================================================
+
+
+@pytest.fixture(scope="class")
+def hub_env(tmp_path_factory: pytest.TempPathFactory) -> SimpleNamespace:
+    """
+    Return a HubManager with a scratch repo dir and checkout target.
+
+    Shared by every test in a class, so only use it in tests that mock out
+    git/tar and never write into these paths.
+    """
+    root = tmp_path_factory.mktemp("hub")
+    repo_path = root / "test-repo"
+    repo_path.mkdir()
+    return SimpleNamespace(
+        hub=HubManager(cache_dir=root / "cache"),
+        repo_path=repo_path,
+        target_dir=root / "checkout",
+    )
+
+
+# ============================================================================
+# Loaded Component Fixtures
+# ============================================================================
+# Loading a mock repo goes through the hub (revision lookup, cache copy,
+# module import, config.yaml parse), so read-only tests share one instance.
+
+
+@pytest.fixture(scope="session")
+def loaded_scaffold(mock_scaffold_repo: Path):
+    """Return the test-scaffold mock repo loaded via AutoScaffold."""
+    return AutoScaffold.from_repo(mock_scaffold_repo)
+
+
+@pytest.fixture(scope="session")
+def loaded_environment(mock_environment_repo: Path):
+    """Return the test-environment mock repo loaded via AutoEnvironment."""
+    return AutoEnvironment.from_repo(mock_environment_repo)
+
+
+@pytest.fixture(scope="session")
+def loaded_workflow(mock_workflow_repo: Path):
+    """Return the test-workflow mock repo loaded via AutoWorkflow."""
+    return AutoWorkflow.from_repo(mock_workflow_repo)
+
+
+@pytest.fixture(scope="session")
+def loaded_task(mock_task_repo: Path):
+    """Return the test-task mock repo loaded via AutoTask."""
+    return AutoTask.from_repo(mock_task_repo)
+
+
 # ============================================================================
 # Schema Fixtures
 # ============================================================================
+# The config and job fixtures are session-scoped: the models are frozen, so
+# one validated instance can be shared by every test. Derive variants with
+# model_copy(update=...) rather than mutating the nested params dicts.
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_scaffold_config() -> ScaffoldConfig:
     """Return a sample ScaffoldConfig."""
     return ScaffoldConfig(
@@ -87,7 +148,7 @@ def sample_scaffold_config() -> ScaffoldConfig:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_environment_config() -> EnvironmentConfig:
     """Return a sample EnvironmentConfig."""
     return EnvironmentConfig(
@@ -100,7 +161,7 @@ def sample_environment_config() -> EnvironmentConfig:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_workflow_config(
     sample_scaffold_config: ScaffoldConfig,
     sample_environment_config: EnvironmentConfig,
@@ -123,7 +184,7 @@ def sample_workflow_config(
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_runtime_config() -> RuntimeConfig:
     """Return a sample RuntimeConfig."""
     return RuntimeConfig(
@@ -139,13 +200,17 @@ def sample_runtime_config() -> RuntimeConfig:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_job(
     sample_workflow_config: WorkflowConfig,
     sample_runtime_config: RuntimeConfig,
 ) -> XJob:
-    """Return a complete sample XJob."""
-    return XJob(
+    """Return a complete sample XJob.
+
+    Built with XJob.new_fast: the sub-configs are already validated models, so
+    the job itself skips a second validation pass.
+    """
+    return XJob.new_fast(
         name="test-swe-bench-job",
         description="A test SWE-bench job for unit testing",
         tags=["test", "swe-bench", "unit"],
@@ -155,6 +220,12 @@ def sample_job(
     )
 
 
+@pytest.fixture(scope="session")
+def sample_job_json(sample_job: XJob) -> str:
+    """Return sample_job serialized to JSON (for deserialization tests)."""
+    return sample_job.model_dump_json()
+
+
 @pytest.fixture
 def sample_job_dict() -> dict:
     """Return a sample XJob as a raw dictionary (for deserialization tests)."""
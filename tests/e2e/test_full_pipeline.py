@@ -10,7 +10,7 @@ All network calls are avoided; mock repos are loaded from the local filesystem.
 
 import pytest
 
-from interaxions import AutoEnvironment, AutoScaffold, AutoWorkflow
+from interaxions import AutoEnvironment, AutoScaffold
 from interaxions.schemas import (
     EnvironmentConfig,
     RuntimeConfig,
@@ -76,10 +76,9 @@ class TestXJobConstruction:
         assert params["environment"]["id"] == "astropy__astropy-12907"
         assert params["model"]["type"] == "litellm"
 
-    def test_json_round_trip(self, sample_job):
+    def test_json_round_trip(self, sample_job, sample_job_json):
         """XJob can be serialised to JSON and fully restored."""
-        json_str = sample_job.model_dump_json()
-        restored = XJob.model_validate_json(json_str)
+        restored = XJob.model_validate_json(sample_job_json)
 
         assert restored.job_id == sample_job.job_id
         assert restored.name == sample_job.name
@@ -122,41 +121,32 @@ class TestXJobConstruction:
 class TestComponentLoading:
     """End-to-end component loading via Auto* classes from local mock repos."""
 
-    def test_load_all_three_components(
-        self, mock_scaffold_repo, mock_environment_repo, mock_workflow_repo
-    ):
+    def test_load_all_three_components(self, loaded_scaffold, loaded_environment, loaded_workflow):
         """All three Auto* classes can load from local repositories."""
-        scaffold = AutoScaffold.from_repo(mock_scaffold_repo)
-        env_task = AutoEnvironment.from_repo(mock_environment_repo)
-        workflow = AutoWorkflow.from_repo(mock_workflow_repo)
-
-        assert scaffold is not None
-        assert env_task is not None
-        assert workflow is not None
+        assert loaded_scaffold is not None
+        assert loaded_environment is not None
+        assert loaded_workflow is not None
 
-    def test_environment_get_returns_environment(self, mock_environment_repo):
+    def test_environment_get_returns_environment(self, loaded_environment):
         """Full pipeline: load env executor → call get() → receive Environment."""
-        env_task = AutoEnvironment.from_repo(mock_environment_repo)
-        env = env_task.get("django__django-12345")
+        env = loaded_environment.get("django__django-12345")
 
         assert isinstance(env, Environment)
         assert env.id == "django__django-12345"
         assert env.type == "test-environment"
         assert isinstance(env.data, dict)
 
-    def test_environment_data_accessible_in_workflow(self, mock_environment_repo):
+    def test_environment_data_accessible_in_workflow(self, loaded_environment):
         """Environment.data is accessible after get(), suitable for downstream use."""
-        env_task = AutoEnvironment.from_repo(mock_environment_repo)
-        env = env_task.get("astropy__astropy-12907")
+        env = loaded_environment.get("astropy__astropy-12907")
 
         # Downstream code (scaffold, workflow) uses env.data["key"]
         assert "instance_id" in env.data
         assert env.data["instance_id"] == "astropy__astropy-12907"
 
-    def test_environment_subclass_pattern(self, mock_environment_repo):
+    def test_environment_subclass_pattern(self, loaded_environment):
         """Workflow-specific Environment subclass can extend the base Environment."""
-        env_task = AutoEnvironment.from_repo(mock_environment_repo)
-        base_env = env_task.get("test-123")
+        base_env = loaded_environment.get("test-123")
 
         # Simulate what a workflow does: wrap base env in a typed domain object
         class MyWorkflowEnv(Environment):
@@ -1,31 +0,0 @@
-"""
-Test workflow implementation for testing.
-"""
-
-from typing import TYPE_CHECKING, Any, Literal, Optional, Dict
-
-from pydantic import Field
-
-from interaxions.workflows.base_workflow import BaseWorkflow, BaseWorkflowConfig
-
-if TYPE_CHECKING:
-    from hera.workflows import Workflow
-    from interaxions.schemas.job import XJob
-
-
-class TestWorkflowConfig(BaseWorkflowConfig):
-    """Configuration for test workflow."""
-    type: Literal["test-workflow"] = Field(default="test-workflow")
-    templates: Optional[Dict[str, str]] = Field(default=None, description="Jinja2 templates")
-
-
-class TestWorkflow(BaseWorkflow):
-    """Test workflow for unit testing."""
-    
-    config_class = TestWorkflowConfig
-    config: TestWorkflowConfig
-    
-    def create_workflow(self, job: "XJob", **kwargs: Any) -> "Workflow":
-        """Create test workflow."""
-        raise NotImplementedError("Test workflow doesn't implement create_workflow")
-
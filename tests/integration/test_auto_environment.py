@@ -8,6 +8,8 @@ exposes two methods:
   - create_task(...)  → hera Task
 """
 
+from pathlib import Path
+
 import pytest
 
 from interaxions import AutoEnvironment
@@ -19,120 +21,91 @@ from interaxions.schemas.task import Environment
 class TestAutoEnvironmentFromLocalPath:
     """Tests for loading a BaseEnvironment from a local path."""
 
-    def test_load_from_string_path(self, mock_environment_repo):
-        """AutoEnvironment.from_repo() accepts a string path."""
-        env_task = AutoEnvironment.from_repo(str(mock_environment_repo))
+    @pytest.mark.parametrize("path_type", [str, Path], ids=["str", "Path"])
+    def test_load_from_local_path(self, mock_environment_repo, path_type):
+        """AutoEnvironment.from_repo() accepts a string path or a Path object."""
+        env_task = AutoEnvironment.from_repo(path_type(mock_environment_repo))
 
-        assert env_task is not None
         assert isinstance(env_task, BaseEnvironment)
 
-    def test_load_from_path_object(self, mock_environment_repo):
-        """AutoEnvironment.from_repo() accepts a Path object."""
-        env_task = AutoEnvironment.from_repo(mock_environment_repo)
-
-        assert env_task is not None
-        assert isinstance(env_task, BaseEnvironment)
-
-    def test_has_config(self, mock_environment_repo):
+    def test_has_config(self, loaded_environment):
         """Loaded environment executor exposes a populated config."""
-        env_task = AutoEnvironment.from_repo(mock_environment_repo)
-
-        assert hasattr(env_task, "config")
-        assert env_task.config is not None
-        assert isinstance(env_task.config, BaseEnvironmentConfig)
+        assert hasattr(loaded_environment, "config")
+        assert isinstance(loaded_environment.config, BaseEnvironmentConfig)
 
-    def test_config_type_matches_yaml(self, mock_environment_repo):
+    def test_config_type_matches_yaml(self, loaded_environment):
         """Config type matches the value in config.yaml."""
-        env_task = AutoEnvironment.from_repo(mock_environment_repo)
+        assert loaded_environment.config.type == "test-environment"
 
-        assert env_task.config.type == "test-environment"
-
-    def test_has_get_method(self, mock_environment_repo):
+    def test_has_get_method(self, loaded_environment):
         """Loaded executor exposes callable get() method."""
-        env_task = AutoEnvironment.from_repo(mock_environment_repo)
-
-        assert hasattr(env_task, "get")
-        assert callable(env_task.get)
+        assert hasattr(loaded_environment, "get")
+        assert callable(loaded_environment.get)
 
-    def test_has_create_task_method(self, mock_environment_repo):
+    def test_has_create_task_method(self, loaded_environment):
         """Loaded executor exposes callable create_task() method."""
-        env_task = AutoEnvironment.from_repo(mock_environment_repo)
-
-        assert hasattr(env_task, "create_task")
-        assert callable(env_task.create_task)
+        assert hasattr(loaded_environment, "create_task")
+        assert callable(loaded_environment.create_task)
 
 
 @pytest.mark.integration
 class TestEnvironmentGet:
     """Tests for BaseEnvironment.get() returning an Environment data object."""
 
-    def test_get_returns_environment(self, mock_environment_repo):
+    def test_get_returns_environment(self, loaded_environment):
         """get() returns an Environment instance."""
-        env_task = AutoEnvironment.from_repo(mock_environment_repo)
-        env = env_task.get("django__django-12345")
+        env = loaded_environment.get("django__django-12345")
 
-        assert env is not None
         assert isinstance(env, Environment)
 
-    def test_get_preserves_id(self, mock_environment_repo):
+    def test_get_preserves_id(self, loaded_environment):
         """Returned Environment.id matches the queried id."""
-        env_task = AutoEnvironment.from_repo(mock_environment_repo)
-        env = env_task.get("astropy__astropy-12907")
+        env = loaded_environment.get("astropy__astropy-12907")
 
         assert env.id == "astropy__astropy-12907"
 
-    def test_get_type_matches_config(self, mock_environment_repo):
+    def test_get_type_matches_config(self, loaded_environment):
         """Returned Environment.type matches the repo's config type."""
-        env_task = AutoEnvironment.from_repo(mock_environment_repo)
-        env = env_task.get("any-instance")
+        env = loaded_environment.get("any-instance")
 
         assert env.type == "test-environment"
 
-    def test_get_data_is_dict(self, mock_environment_repo):
+    def test_get_data_is_dict(self, loaded_environment):
         """Returned Environment.data is a dict."""
-        env_task = AutoEnvironment.from_repo(mock_environment_repo)
-        env = env_task.get("test-123")
+        env = loaded_environment.get("test-123")
 
         assert isinstance(env.data, dict)
 
-    def test_get_data_contains_instance_id(self, mock_environment_repo):
+    def test_get_data_contains_instance_id(self, loaded_environment):
         """Returned Environment.data contains at least the instance_id."""
-        env_task = AutoEnvironment.from_repo(mock_environment_repo)
-        env = env_task.get("my-instance-456")
+        env = loaded_environment.get("my-instance-456")
 
         assert "instance_id" in env.data
         assert env.data["instance_id"] == "my-instance-456"
 
-    def test_get_different_ids(self, mock_environment_repo):
+    def test_get_different_ids(self, loaded_environment):
         """Calling get() with different ids returns different Environments."""
-        env_task = AutoEnvironment.from_repo(mock_environment_repo)
-        env1 = env_task.get("instance-1")
-        env2 = env_task.get("instance-2")
+        env1 = loaded_environment.get("instance-1")
+        env2 = loaded_environment.get("instance-2")
 
         assert env1.id != env2.id
         assert env1.data["instance_id"] != env2.data["instance_id"]
 
-    def test_environment_serializable(self, mock_environment_repo):
+    def test_environment_serializable(self, loaded_environment):
         """Environment returned by get() is JSON-serializable."""
-        env_task = AutoEnvironment.from_repo(mock_environment_repo)
-        env = env_task.get("test-inst")
-
-        json_str = env.model_dump_json()
-        assert env.id in json_str
+        env = loaded_environment.get("test-inst")
 
-        restored = Environment.model_validate_json(json_str)
-        assert restored.id == env.id
-        assert restored.data == env.data
+        restored = Environment.model_validate_json(env.model_dump_json())
+        assert restored == env
 
 
 @pytest.mark.integration
 class TestAutoEnvironmentDiscovery:
     """Tests for the automatic class discovery in ix.py."""
 
-    def test_discovers_correct_class(self, mock_environment_repo):
+    def test_discovers_correct_class(self, loaded_environment):
         """AutoEnvironment discovers the single BaseEnvironment subclass."""
-        env_task = AutoEnvironment.from_repo(mock_environment_repo)
-        assert type(env_task).__name__ == "TestEnvironment"
+        assert type(loaded_environment).__name__ == "TestEnvironment"
 
     def test_invalid_path_raises(self, tmp_path):
         """Loading from a directory with no config.yaml raises FileNotFoundError."""
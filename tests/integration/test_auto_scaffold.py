@@ -6,6 +6,8 @@ Built-in scaffolds have been removed; all components are now loaded from
 external repositories via local paths or remote Git URLs.
 """
 
+from pathlib import Path
+
 import pytest
 
 from interaxions import AutoScaffold
@@ -16,67 +18,47 @@ from interaxions.scaffolds.base_scaffold import BaseScaffold, BaseScaffoldConfig
 class TestAutoScaffoldFromLocalPath:
     """Tests for loading a scaffold from a local path."""
 
-    def test_load_from_string_path(self, mock_scaffold_repo):
-        """AutoScaffold.from_repo() accepts a string path."""
-        scaffold = AutoScaffold.from_repo(str(mock_scaffold_repo))
+    @pytest.mark.parametrize("path_type", [str, Path], ids=["str", "Path"])
+    def test_load_from_local_path(self, mock_scaffold_repo, path_type):
+        """AutoScaffold.from_repo() accepts a string path or a Path object."""
+        scaffold = AutoScaffold.from_repo(path_type(mock_scaffold_repo))
 
-        assert scaffold is not None
         assert isinstance(scaffold, BaseScaffold)
 
-    def test_load_from_path_object(self, mock_scaffold_repo):
-        """AutoScaffold.from_repo() accepts a Path object."""
-        scaffold = AutoScaffold.from_repo(mock_scaffold_repo)
-
-        assert scaffold is not None
-        assert isinstance(scaffold, BaseScaffold)
-
-    def test_scaffold_has_config(self, mock_scaffold_repo):
+    def test_scaffold_has_config(self, loaded_scaffold):
         """Loaded scaffold exposes a populated config attribute."""
-        scaffold = AutoScaffold.from_repo(mock_scaffold_repo)
-
-        assert hasattr(scaffold, "config")
-        assert scaffold.config is not None
-        assert isinstance(scaffold.config, BaseScaffoldConfig)
+        assert hasattr(loaded_scaffold, "config")
+        assert isinstance(loaded_scaffold.config, BaseScaffoldConfig)
 
-    def test_config_type_matches_yaml(self, mock_scaffold_repo):
+    def test_config_type_matches_yaml(self, loaded_scaffold):
         """Config type field matches the value in config.yaml."""
-        scaffold = AutoScaffold.from_repo(mock_scaffold_repo)
+        assert loaded_scaffold.config.type == "test-scaffold"
 
-        assert scaffold.config.type == "test-scaffold"
-
-    def test_config_custom_fields_loaded(self, mock_scaffold_repo):
+    def test_config_custom_fields_loaded(self, loaded_scaffold):
         """Config fields defined in config.yaml are accessible."""
-        scaffold = AutoScaffold.from_repo(mock_scaffold_repo)
-
-        assert hasattr(scaffold.config, "test_param")
-        assert scaffold.config.test_param == "test_value"
-        assert scaffold.config.max_iterations == 5
+        assert hasattr(loaded_scaffold.config, "test_param")
+        assert loaded_scaffold.config.test_param == "test_value"
+        assert loaded_scaffold.config.max_iterations == 5
 
-    def test_has_create_task_method(self, mock_scaffold_repo):
+    def test_has_create_task_method(self, loaded_scaffold):
         """Scaffold has callable create_task method."""
-        scaffold = AutoScaffold.from_repo(mock_scaffold_repo)
-
-        assert hasattr(scaffold, "create_task")
-        assert callable(scaffold.create_task)
+        assert hasattr(loaded_scaffold, "create_task")
+        assert callable(loaded_scaffold.create_task)
 
-    def test_has_from_repo_class_method(self, mock_scaffold_repo):
+    def test_has_from_repo_class_method(self, loaded_scaffold):
         """Scaffold class exposes from_repo class method."""
-        scaffold = AutoScaffold.from_repo(mock_scaffold_repo)
-
-        assert hasattr(scaffold, "from_repo")
-        assert callable(scaffold.from_repo)
+        assert hasattr(loaded_scaffold, "from_repo")
+        assert callable(loaded_scaffold.from_repo)
 
 
 @pytest.mark.integration
 class TestAutoScaffoldDiscovery:
     """Tests for the automatic class discovery in ix.py."""
 
-    def test_discovers_correct_class(self, mock_scaffold_repo):
+    def test_discovers_correct_class(self, loaded_scaffold):
         """AutoScaffold discovers the single BaseScaffold subclass in ix.py."""
-        scaffold = AutoScaffold.from_repo(mock_scaffold_repo)
-
         # The concrete class should be TestScaffold from the mock repo
-        assert type(scaffold).__name__ == "TestScaffold"
+        assert type(loaded_scaffold).__name__ == "TestScaffold"
 
     def test_invalid_path_raises(self, tmp_path):
         """Loading from a path with no config.yaml raises FileNotFoundError."""
@@ -4,6 +4,8 @@ Integration tests for AutoTask dynamic loading from local repositories.
 All tests use the test-task mock repo in tests/fixtures/mock_repos/.
 """
 
+from pathlib import Path
+
 import pytest
 
 from interaxions.hub import AutoTask
@@ -14,73 +16,51 @@ from interaxions.tasks.base_task import BaseTask, BaseTaskConfig
 class TestAutoTaskFromLocalPath:
     """Tests for loading a task from a local path."""
 
-    def test_load_from_string_path(self, mock_task_repo):
-        """AutoTask.from_repo() accepts a string path."""
-        task = AutoTask.from_repo(str(mock_task_repo))
-
-        assert task is not None
-        assert isinstance(task, BaseTask)
-
-    def test_load_from_path_object(self, mock_task_repo):
-        """AutoTask.from_repo() accepts a Path object."""
-        task = AutoTask.from_repo(mock_task_repo)
+    @pytest.mark.parametrize("path_type", [str, Path], ids=["str", "Path"])
+    def test_load_from_local_path(self, mock_task_repo, path_type):
+        """AutoTask.from_repo() accepts a string path or a Path object."""
+        task = AutoTask.from_repo(path_type(mock_task_repo))
 
-        assert task is not None
         assert isinstance(task, BaseTask)
 
-    def test_has_config(self, mock_task_repo):
+    def test_has_config(self, loaded_task):
         """Loaded task exposes a populated config attribute."""
-        task = AutoTask.from_repo(mock_task_repo)
-
-        assert hasattr(task, "config")
-        assert task.config is not None
-        assert isinstance(task.config, BaseTaskConfig)
+        assert hasattr(loaded_task, "config")
+        assert isinstance(loaded_task.config, BaseTaskConfig)
 
-    def test_config_type_matches_yaml(self, mock_task_repo):
+    def test_config_type_matches_yaml(self, loaded_task):
         """Config type field matches the value in config.yaml."""
-        task = AutoTask.from_repo(mock_task_repo)
-
-        assert task.config.type == "test-task"
+        assert loaded_task.config.type == "test-task"
 
-    def test_config_custom_fields_loaded(self, mock_task_repo):
+    def test_config_custom_fields_loaded(self, loaded_task):
         """Config fields defined in config.yaml are accessible."""
-        task = AutoTask.from_repo(mock_task_repo)
+        assert hasattr(loaded_task.config, "image")
+        assert loaded_task.config.image == "ghcr.io/ix-hub/test-task:latest"
+        assert loaded_task.config.command == "python run.py"
 
-        assert hasattr(task.config, "image")
-        assert task.config.image == "ghcr.io/ix-hub/test-task:latest"
-        assert task.config.command == "python run.py"
-
-    def test_has_create_task_method(self, mock_task_repo):
+    def test_has_create_task_method(self, loaded_task):
         """Task has callable create_task method."""
-        task = AutoTask.from_repo(mock_task_repo)
-
-        assert hasattr(task, "create_task")
-        assert callable(task.create_task)
+        assert hasattr(loaded_task, "create_task")
+        assert callable(loaded_task.create_task)
 
-    def test_has_from_repo_class_method(self, mock_task_repo):
+    def test_has_from_repo_class_method(self, loaded_task):
         """Task class exposes from_repo class method."""
-        task = AutoTask.from_repo(mock_task_repo)
-
-        assert hasattr(task, "from_repo")
-        assert callable(task.from_repo)
+        assert hasattr(loaded_task, "from_repo")
+        assert callable(loaded_task.from_repo)
 
-    def test_has_render_template_method(self, mock_task_repo):
+    def test_has_render_template_method(self, loaded_task):
         """Task exposes render_template inherited from BaseRepo."""
-        task = AutoTask.from_repo(mock_task_repo)
-
-        assert hasattr(task, "render_template")
-        assert callable(task.render_template)
+        assert hasattr(loaded_task, "render_template")
+        assert callable(loaded_task.render_template)
 
 
 @pytest.mark.integration
 class TestAutoTaskDiscovery:
     """Tests for the automatic class discovery in ix.py."""
 
-    def test_discovers_correct_class(self, mock_task_repo):
+    def test_discovers_correct_class(self, loaded_task):
         """AutoTask discovers the single BaseTask subclass in ix.py."""
-        task = AutoTask.from_repo(mock_task_repo)
-
-        assert type(task).__name__ == "TestTask"
+        assert type(loaded_task).__name__ == "TestTask"
 
     def test_invalid_path_raises(self, tmp_path):
         """Loading from a path with no config.yaml raises FileNotFoundError."""
@@ -141,8 +121,6 @@ class TestBaseTaskConfig:
         )
 
         from interaxions.tasks.base_task import BaseTaskConfig as BTC
-        from typing import Dict
-        from pydantic import Field as F
 
         class _Cfg(BTC):
             type: str
@@ -6,6 +6,8 @@ Built-in workflows have been removed; all components are loaded from
 external repositories via local paths or remote Git URLs.
 """
 
+from pathlib import Path
+
 import pytest
 
 from interaxions import AutoWorkflow
@@ -16,42 +18,28 @@ from interaxions.workflows.base_workflow import BaseWorkflow, BaseWorkflowConfig
 class TestAutoWorkflowFromLocalPath:
     """Tests for loading a workflow from a local path."""
 
-    def test_load_from_string_path(self, mock_workflow_repo):
-        """AutoWorkflow.from_repo() accepts a string path."""
-        workflow = AutoWorkflow.from_repo(str(mock_workflow_repo))
+    @pytest.mark.parametrize("path_type", [str, Path], ids=["str", "Path"])
+    def test_load_from_local_path(self, mock_workflow_repo, path_type):
+        """AutoWorkflow.from_repo() accepts a string path or a Path object."""
+        workflow = AutoWorkflow.from_repo(path_type(mock_workflow_repo))
 
-        assert workflow is not None
         assert isinstance(workflow, BaseWorkflow)
 
-    def test_load_from_path_object(self, mock_workflow_repo):
-        """AutoWorkflow.from_repo() accepts a Path object."""
-        workflow = AutoWorkflow.from_repo(mock_workflow_repo)
-
-        assert workflow is not None
-        assert isinstance(workflow, BaseWorkflow)
-
-    def test_has_config(self, mock_workflow_repo):
+    def test_has_config(self, loaded_workflow):
         """Loaded workflow has a populated config attribute."""
-        workflow = AutoWorkflow.from_repo(mock_workflow_repo)
-
-        assert hasattr(workflow, "config")
-        assert workflow.config is not None
-        assert isinstance(workflow.config, BaseWorkflowConfig)
+        assert hasattr(loaded_workflow, "config")
+        assert isinstance(loaded_workflow.config, BaseWorkflowConfig)
 
-    def test_config_type_matches_yaml(self, mock_workflow_repo):
+    def test_config_type_matches_yaml(self, loaded_workflow):
         """Config type matches the value in config.yaml."""
-        workflow = AutoWorkflow.from_repo(mock_workflow_repo)
+        assert loaded_workflow.config.type == "test-workflow"
 
-        assert workflow.config.type == "test-workflow"
-
-    def test_templates_loaded_from_yaml(self, mock_workflow_repo):
+    def test_templates_loaded_from_yaml(self, loaded_workflow):
         """Templates referenced in config.yaml are loaded as strings."""
-        workflow = AutoWorkflow.from_repo(mock_workflow_repo)
-
-        assert hasattr(workflow.config, "templates")
-        assert workflow.config.templates is not None
+        assert hasattr(loaded_workflow.config, "templates")
+        assert loaded_workflow.config.templates is not None
 
-        templates = workflow.config.templates
+        templates = loaded_workflow.config.templates
         assert "main" in templates
         assert "verification" in templates
         # Check that they contain the expected template content
@@ -59,29 +47,24 @@ class TestAutoWorkflowFromLocalPath:
         assert isinstance(templates["verification"], str)
         assert len(templates["main"]) > 0
 
-    def test_has_create_workflow_method(self, mock_workflow_repo):
+    def test_has_create_workflow_method(self, loaded_workflow):
         """Loaded workflow has callable create_workflow method."""
-        workflow = AutoWorkflow.from_repo(mock_workflow_repo)
+        assert hasattr(loaded_workflow, "create_workflow")
+        assert callable(loaded_workflow.create_workflow)
 
-        assert hasattr(workflow, "create_workflow")
-        assert callable(workflow.create_workflow)
-
-    def test_has_from_repo_class_method(self, mock_workflow_repo):
+    def test_has_from_repo_class_method(self, loaded_workflow):
         """Workflow class exposes from_repo class method."""
-        workflow = AutoWorkflow.from_repo(mock_workflow_repo)
-
-        assert hasattr(workflow, "from_repo")
-        assert callable(workflow.from_repo)
+        assert hasattr(loaded_workflow, "from_repo")
+        assert callable(loaded_workflow.from_repo)
 
 
 @pytest.mark.integration
 class TestAutoWorkflowDiscovery:
     """Tests for the automatic class discovery in ix.py."""
 
-    def test_discovers_correct_class(self, mock_workflow_repo):
+    def test_discovers_correct_class(self, loaded_workflow):
         """AutoWorkflow discovers the single BaseWorkflow subclass in ix.py."""
-        workflow = AutoWorkflow.from_repo(mock_workflow_repo)
-        assert type(workflow).__name__ == "TestWorkflow"
+        assert type(loaded_workflow).__name__ == "TestWorkflow"
 
     def test_invalid_path_raises(self, tmp_path):
         """Loading from a directory with no config.yaml raises FileNotFoundError."""
@@ -14,7 +14,7 @@ import yaml
 
 from pydantic import Field
 
-from interaxions.base import BaseRepo, BaseRepoConfig
+from interaxions.base import BaseRepo, BaseRepoConfig, _compile_template
 
 
 # ---------------------------------------------------------------------------
@@ -216,6 +216,15 @@ class TestRenderTemplate:
         result = repo.render_template("script", {"a": "1", "b": "2", "c": "3"})
         assert result == "1 + 2 = 3"
 
+    def test_repeated_renders_reuse_compiled_template(self, tmp_path: Path):
+        """The same template source is compiled once and rendered many times."""
+        repo = self._make_repo(tmp_path, {"main": "Hello {{ name }}!"})
+        _compile_template.cache_clear()
+        assert repo.render_template("main", {"name": "a"}) == "Hello a!"
+        assert repo.render_template("main", {"name": "b"}) == "Hello b!"
+        info = _compile_template.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
     def test_raises_when_no_templates_in_config(self, tmp_path: Path):
         """Raises ValueError when config has no templates attribute."""
         repo = self._make_repo(tmp_path)  # no templates
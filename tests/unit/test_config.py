@@ -2,39 +2,43 @@
 Unit tests for configuration loading and merging.
 """
 
+import os
 from pathlib import Path
+from typing import Any, Dict
 
 import pytest
 import yaml
 
-from interaxions.scaffolds.base_scaffold import BaseScaffoldConfig
-from interaxions.environments.base_environment import BaseEnvironmentConfig
-from interaxions.workflows.base_workflow import BaseWorkflowConfig
+# Use libyaml's C loader/dumper when available, as BaseRepoConfig does.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def _yaml_roundtrip(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Dump data to YAML and parse it back, without touching the filesystem."""
+    return yaml.load(yaml.dump(data, Dumper=_YamlDumper), Loader=_YamlLoader)
 
 
 @pytest.mark.unit
 class TestConfigLoading:
     """Tests for configuration loading from YAML files."""
 
-    def test_load_simple_config(self, tmp_path: Path):
+    def test_load_simple_config(self):
         """Test loading a simple YAML configuration."""
-        config_file = tmp_path / "config.yaml"
         config_data = {
             "type": "test-type",
             "param1": "value1",
             "param2": 42,
         }
-        config_file.write_text(yaml.dump(config_data))
-        
+
         # Load config
-        loaded = yaml.safe_load(config_file.read_text())
+        loaded = _yaml_roundtrip(config_data)
         assert loaded["type"] == "test-type"
         assert loaded["param1"] == "value1"
         assert loaded["param2"] == 42
 
-    def test_load_nested_config(self, tmp_path: Path):
+    def test_load_nested_config(self):
         """Test loading a configuration with nested structure."""
-        config_file = tmp_path / "config.yaml"
         config_data = {
             "type": "test",
             "nested": {
@@ -45,23 +49,20 @@ class TestConfigLoading:
                 },
             },
         }
-        config_file.write_text(yaml.dump(config_data))
-        
-        loaded = yaml.safe_load(config_file.read_text())
+
+        loaded = _yaml_roundtrip(config_data)
         assert loaded["nested"]["key1"] == "value1"
         assert loaded["nested"]["deep"]["level3"] == "value3"
 
-    def test_load_config_with_lists(self, tmp_path: Path):
+    def test_load_config_with_lists(self):
         """Test loading configuration with list values."""
-        config_file = tmp_path / "config.yaml"
         config_data = {
             "type": "test",
             "items": ["item1", "item2", "item3"],
             "numbers": [1, 2, 3, 4, 5],
         }
-        config_file.write_text(yaml.dump(config_data))
-        
-        loaded = yaml.safe_load(config_file.read_text())
+
+        loaded = _yaml_roundtrip(config_data)
         assert loaded["items"] == ["item1", "item2", "item3"]
         assert loaded["numbers"] == [1, 2, 3, 4, 5]
 
@@ -78,7 +79,7 @@ class TestConfigLoading:
         config_file.write_text("invalid: yaml: syntax: [[[")
         
         with pytest.raises(yaml.YAMLError):
-            yaml.safe_load(config_file.read_text())
+            yaml.load(config_file.read_text(), Loader=_YamlLoader)
 
 
 @pytest.mark.unit
@@ -90,11 +91,12 @@ class TestConfigMerging:
         defaults = {"key1": "value1", "key2": "value2"}
         overrides = {"key2": "new_value2", "key3": "value3"}
         
-        merged = {**defaults, **overrides}
+        merged = defaults | overrides
         
         assert merged["key1"] == "value1"
         assert merged["key2"] == "new_value2"  # Overridden
         assert merged["key3"] == "value3"       # New key
+        assert merged == {**defaults, **overrides}
 
     def test_merge_nested_configs(self):
         """Test merging nested dictionaries."""
@@ -117,15 +119,13 @@ class TestConfigMerging:
         assert merged_shallow["level1"]["key2"] == "new_value2"
         assert "key1" not in merged_shallow["level1"]  # Lost in shallow merge
 
-    def test_config_defaults(self, tmp_path: Path):
+    def test_config_defaults(self):
         """Test that configuration classes have appropriate defaults."""
         # BaseScaffoldConfig should have a type field
         # (we can't instantiate abstract classes directly, so we test the pattern)
-        config_file = tmp_path / "config.yaml"
         config_data = {"type": "test-scaffold"}
-        config_file.write_text(yaml.dump(config_data))
-        
-        loaded = yaml.safe_load(config_file.read_text())
+
+        loaded = _yaml_roundtrip(config_data)
         assert "type" in loaded
 
 
@@ -161,13 +161,19 @@ class TestConfigTypes:
         assert config_data["type"] == "rollout-and-verify"
 
 
+@pytest.fixture(scope="class")
+def shared_tmp(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One scratch directory per class; each test works in its own subdirectory."""
+    return tmp_path_factory.mktemp("tmpl")
+
+
 @pytest.mark.unit
 class TestTemplateFiles:
     """Tests for template file operations."""
 
-    def test_create_template_file(self, tmp_path: Path):
+    def test_create_template_file(self, shared_tmp: Path):
         """Test creating a template file."""
-        template_path = tmp_path / "templates" / "main.j2"
+        template_path = shared_tmp / "single" / "templates" / "main.j2"
         template_path.parent.mkdir(parents=True, exist_ok=True)
         
         template_content = "Hello {{ name }}!"
@@ -176,9 +182,10 @@ class TestTemplateFiles:
         assert template_path.exists()
         assert template_path.read_text() == template_content
 
-    def test_template_with_variables(self, tmp_path: Path):
+    def test_template_with_variables(self, shared_tmp: Path):
         """Test template content with Jinja2 variables."""
-        template_path = tmp_path / "template.j2"
+        template_path = shared_tmp / "vars" / "template.j2"
+        template_path.parent.mkdir(parents=True, exist_ok=True)
         template_content = """
 name: {{ name }}
 value: {{ value }}
@@ -191,9 +198,9 @@ list: {{ items | join(', ') }}
         assert "{{ value }}" in content
         assert "{{ items | join(', ') }}" in content
 
-    def test_multiple_template_files(self, tmp_path: Path):
+    def test_multiple_template_files(self, shared_tmp: Path):
         """Test managing multiple template files."""
-        templates_dir = tmp_path / "templates"
+        templates_dir = shared_tmp / "multi"
         templates_dir.mkdir()
         
         # Create multiple templates
@@ -213,6 +220,7 @@ list: {{ items | join(', ') }}
         assert (templates_dir / "verify.j2").exists()
         
         # Count template files
-        template_files = list(templates_dir.glob("*.j2"))
+        with os.scandir(templates_dir) as entries:
+            template_files = [entry.name for entry in entries if entry.name.endswith(".j2")]
         assert len(template_files) == 3
 
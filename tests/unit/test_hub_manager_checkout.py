@@ -1,8 +1,10 @@
 """Test hub manager checkout revision functionality."""
 
 import subprocess
-import tempfile
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Iterator
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -10,238 +12,128 @@ import pytest
 from interaxions.hub.hub_manager import HubManager
 
 
-class TestCheckoutRevision:
-    """Test _checkout_revision method."""
-
-    def test_checkout_revision_uses_popen_correctly(self):
-        """Test that _checkout_revision uses subprocess.Popen correctly for git archive piping."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir = Path(tmpdir)
-
-            # Create a fake git repo directory
-            repo_path = tmpdir / "test-repo"
-            repo_path.mkdir()
-
-            # Create cache directory
-            cache_dir = tmpdir / "cache"
-            hub = HubManager(cache_dir=cache_dir)
-
-            target_dir = tmpdir / "checkout"
-
-            # Mock subprocess.run for git rev-parse
-            mock_run_result = MagicMock()
-            mock_run_result.stdout = "abc123def456\n"
-
-            # Mock subprocess.Popen for git archive and tar
-            mock_archive_process = MagicMock()
-            mock_archive_process.stdout = MagicMock()
-            mock_archive_process.returncode = 0
-
-            mock_tar_process = MagicMock()
-            mock_tar_process.returncode = 0
-            mock_tar_process.communicate.return_value = (b"", b"")
-
-            # Mock the .git directory check
-            def mock_exists(self):
-                return str(self).endswith(".git")
-
-            with patch("subprocess.run", return_value=mock_run_result) as mock_run, \
-                 patch("subprocess.Popen") as mock_popen, \
-                 patch.object(Path, "exists", mock_exists):
-
-                # Configure mock_popen to return different processes for each call
-                mock_popen.side_effect = [mock_archive_process, mock_tar_process]
-
-                # Execute the method
-                hub._checkout_revision(repo_path, "main", target_dir)
-
-                # Verify git rev-parse was called
-                mock_run.assert_called_once_with(
-                    ["git", "rev-parse", "main"],
-                    cwd=repo_path,
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-
-                # Verify subprocess.Popen was called twice (git archive and tar)
-                assert mock_popen.call_count == 2
-
-                # Check git archive call
-                archive_call = mock_popen.call_args_list[0]
-                assert archive_call[0][0] == ["git", "archive", "abc123def456"]
-                assert archive_call[1]["cwd"] == repo_path
-                assert archive_call[1]["stdout"] == subprocess.PIPE
-
-                # Check tar call
-                tar_call = mock_popen.call_args_list[1]
-                assert tar_call[0][0] == ["tar", "-x", "-C", str(target_dir)]
-                assert tar_call[1]["stdin"] == mock_archive_process.stdout
-                assert tar_call[1]["stdout"] == subprocess.PIPE
-                assert tar_call[1]["stderr"] == subprocess.PIPE
-
-                # Verify archive stdout was closed
-                mock_archive_process.stdout.close.assert_called_once()
-
-                # Verify tar process communicate was called
-                mock_tar_process.communicate.assert_called_once()
-
-    def test_checkout_revision_no_shell_usage(self):
-        """Verify that shell=True is NOT used (fixing the original bug)."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir = Path(tmpdir)
-
-            repo_path = tmpdir / "test-repo"
-            repo_path.mkdir()
-
-            cache_dir = tmpdir / "cache"
-            hub = HubManager(cache_dir=cache_dir)
-
-            target_dir = tmpdir / "checkout"
-
-            mock_run_result = MagicMock()
-            mock_run_result.stdout = "abc123def456\n"
-
-            mock_archive_process = MagicMock()
-            mock_archive_process.stdout = MagicMock()
-            mock_archive_process.returncode = 0
-
-            mock_tar_process = MagicMock()
-            mock_tar_process.returncode = 0
-            mock_tar_process.communicate.return_value = (b"", b"")
-
-            # Mock the .git directory check
-            def mock_exists(self):
-                return str(self).endswith(".git")
-
-            with patch("subprocess.run", return_value=mock_run_result), \
-                 patch("subprocess.Popen") as mock_popen, \
-                 patch.object(Path, "exists", mock_exists):
-
-                mock_popen.side_effect = [mock_archive_process, mock_tar_process]
-
-                hub._checkout_revision(repo_path, "main", target_dir)
-
-                # Verify that shell=True was NOT used in any Popen call
-                for call_args in mock_popen.call_args_list:
-                    kwargs = call_args[1]
-                    assert "shell" not in kwargs or kwargs["shell"] is False
-
-                    # Verify that the command is a list, not a string
-                    command = call_args[0][0]
-                    assert isinstance(command, list)
+def _git_exists(self):
+    """Stand-in for Path.exists that reports only .git paths as present."""
+    return str(self).endswith(".git")
 
-                    # Verify that pipe character is NOT in the command arguments
-                    assert "|" not in command
 
-    def test_checkout_revision_handles_git_archive_error(self):
-        """Test error handling when git archive fails."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir = Path(tmpdir)
+@contextmanager
+def git_mocks(archive_rc: int = 0, tar_rc: int = 0, tar_stderr: bytes = b"", run_stdout: str = "abc123def456\n") -> Iterator[SimpleNamespace]:
+    """Patch git rev-parse, the git archive | tar pipeline and the .git check in one go.
 
-            repo_path = tmpdir / "test-repo"
-            repo_path.mkdir()
+    Yields the ``run`` and ``popen`` patches along with the ``archive`` and ``tar``
+    processes that ``popen`` returns, in that order.
+    """
+    archive = MagicMock(returncode=archive_rc)
+    tar = MagicMock(returncode=tar_rc)
+    tar.communicate.return_value = (b"", tar_stderr)
 
-            cache_dir = tmpdir / "cache"
-            hub = HubManager(cache_dir=cache_dir)
+    with ExitStack() as stack:
+        run = stack.enter_context(patch("subprocess.run", return_value=MagicMock(stdout=run_stdout)))
+        popen = stack.enter_context(patch("subprocess.Popen", side_effect=[archive, tar]))
+        stack.enter_context(patch.object(Path, "exists", _git_exists))
+        yield SimpleNamespace(run=run, popen=popen, archive=archive, tar=tar)
 
-            target_dir = tmpdir / "checkout"
 
-            mock_run_result = MagicMock()
-            mock_run_result.stdout = "abc123def456\n"
-
-            # Mock git archive to fail
-            mock_archive_process = MagicMock()
-            mock_archive_process.stdout = MagicMock()
-            mock_archive_process.returncode = 128  # Git error code
-
-            mock_tar_process = MagicMock()
-            mock_tar_process.returncode = 0
-            mock_tar_process.communicate.return_value = (b"", b"")
-
-            # Mock the .git directory check
-            def mock_exists(self):
-                return str(self).endswith(".git")
-
-            with patch("subprocess.run", return_value=mock_run_result), \
-                 patch("subprocess.Popen") as mock_popen, \
-                 patch.object(Path, "exists", mock_exists):
-
-                mock_popen.side_effect = [mock_archive_process, mock_tar_process]
-
-                # Should raise RuntimeError
-                with pytest.raises(RuntimeError) as exc_info:
-                    hub._checkout_revision(repo_path, "main", target_dir)
-
-                assert "Failed to checkout revision" in str(exc_info.value)
-
-    def test_checkout_revision_handles_tar_error(self):
-        """Test error handling when tar extraction fails."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir = Path(tmpdir)
-
-            repo_path = tmpdir / "test-repo"
-            repo_path.mkdir()
-
-            cache_dir = tmpdir / "cache"
-            hub = HubManager(cache_dir=cache_dir)
-
-            target_dir = tmpdir / "checkout"
+class TestCheckoutRevision:
+    """Test _checkout_revision method."""
 
-            mock_run_result = MagicMock()
-            mock_run_result.stdout = "abc123def456\n"
+    def test_checkout_revision_uses_popen_correctly(self, hub_env):
+        """Test that _checkout_revision uses subprocess.Popen correctly for git archive piping."""
+        hub, repo_path, target_dir = hub_env.hub, hub_env.repo_path, hub_env.target_dir
+
+        with git_mocks() as mocks:
+            hub._checkout_revision(repo_path, "main", target_dir)
+
+        # Verify git rev-parse was called
+        mocks.run.assert_called_once_with(
+            ["git", "rev-parse", "main"],
+            cwd=repo_path,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        # Verify subprocess.Popen was called twice (git archive and tar)
+        assert mocks.popen.call_count == 2
+
+        # Check git archive call
+        archive_call = mocks.popen.call_args_list[0]
+        assert archive_call[0][0] == ["git", "archive", "abc123def456"]
+        assert archive_call[1]["cwd"] == repo_path
+        assert archive_call[1]["stdout"] == subprocess.PIPE
+
+        # Check tar call
+        tar_call = mocks.popen.call_args_list[1]
+        assert tar_call[0][0] == ["tar", "-x", "-C", str(target_dir)]
+        assert tar_call[1]["stdin"] == mocks.archive.stdout
+        assert tar_call[1]["stdout"] == subprocess.PIPE
+        assert tar_call[1]["stderr"] == subprocess.PIPE
+
+        # Verify archive stdout was closed
+        mocks.archive.stdout.close.assert_called_once()
+
+        # Verify tar process communicate was called
+        mocks.tar.communicate.assert_called_once()
+
+    def test_checkout_revision_no_shell_usage(self, hub_env):
+        """Verify that shell=True is NOT used (fixing the original bug)."""
+        hub, repo_path, target_dir = hub_env.hub, hub_env.repo_path, hub_env.target_dir
 
-            mock_archive_process = MagicMock()
-            mock_archive_process.stdout = MagicMock()
-            mock_archive_process.returncode = 0
+        with git_mocks() as mocks:
+            hub._checkout_revision(repo_path, "main", target_dir)
 
-            # Mock tar to fail
-            mock_tar_process = MagicMock()
-            mock_tar_process.returncode = 1
-            mock_tar_process.communicate.return_value = (b"", b"tar: Error extracting")
+        # Verify that shell=True was NOT used in any Popen call
+        for call_args in mocks.popen.call_args_list:
+            kwargs = call_args[1]
+            assert "shell" not in kwargs or kwargs["shell"] is False
 
-            # Mock the .git directory check
-            def mock_exists(self):
-                return str(self).endswith(".git")
+            # Verify that the command is a list, not a string
+            command = call_args[0][0]
+            assert isinstance(command, list)
 
-            with patch("subprocess.run", return_value=mock_run_result), \
-                 patch("subprocess.Popen") as mock_popen, \
-                 patch.object(Path, "exists", mock_exists):
+            # Verify that pipe character is NOT in the command arguments
+            assert "|" not in command
 
-                mock_popen.side_effect = [mock_archive_process, mock_tar_process]
+    @pytest.mark.parametrize(
+        "archive_rc, tar_rc, tar_stderr",
+        [
+            pytest.param(128, 0, b"", id="git-archive-error"),
+            pytest.param(0, 1, b"tar: Error extracting", id="tar-error"),
+        ],
+    )
+    def test_checkout_revision_handles_pipeline_error(self, hub_env, archive_rc, tar_rc, tar_stderr):
+        """Test error handling when either git archive or tar extraction fails."""
+        hub, repo_path, target_dir = hub_env.hub, hub_env.repo_path, hub_env.target_dir
 
-                # Should raise RuntimeError
-                with pytest.raises(RuntimeError) as exc_info:
-                    hub._checkout_revision(repo_path, "main", target_dir)
+        with git_mocks(archive_rc=archive_rc, tar_rc=tar_rc, tar_stderr=tar_stderr), \
+             pytest.raises(RuntimeError) as exc_info:
+            hub._checkout_revision(repo_path, "main", target_dir)
 
-                assert "Failed to checkout revision" in str(exc_info.value)
+        assert "Failed to checkout revision" in str(exc_info.value)
 
-    def test_checkout_revision_non_git_directory(self):
+    def test_checkout_revision_non_git_directory(self, tmp_path):
         """Test that non-git directories are handled by copying."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir = Path(tmpdir)
-
-            # Create a non-git directory with a test file
-            repo_path = tmpdir / "test-dir"
-            repo_path.mkdir()
-            test_file = repo_path / "test.txt"
-            test_file.write_text("test content")
+        # Create a non-git directory with a test file
+        repo_path = tmp_path / "test-dir"
+        repo_path.mkdir()
+        test_file = repo_path / "test.txt"
+        test_file.write_text("test content")
 
-            cache_dir = tmpdir / "cache"
-            hub = HubManager(cache_dir=cache_dir)
+        hub = HubManager(cache_dir=tmp_path / "cache")
 
-            target_dir = tmpdir / "checkout"
+        target_dir = tmp_path / "checkout"
 
-            # Should not call git commands for non-git directories
-            with patch("subprocess.run") as mock_run, \
-                 patch("subprocess.Popen") as mock_popen:
+        # Should not call git commands for non-git directories
+        with patch("subprocess.run") as mock_run, \
+             patch("subprocess.Popen") as mock_popen:
 
-                hub._checkout_revision(repo_path, "main", target_dir)
+            hub._checkout_revision(repo_path, "main", target_dir)
 
-                # Verify no subprocess calls were made
-                mock_run.assert_not_called()
-                mock_popen.assert_not_called()
+            # Verify no subprocess calls were made
+            mock_run.assert_not_called()
+            mock_popen.assert_not_called()
 
-                # Verify the file was copied
-                assert (target_dir / "test.txt").exists()
-                assert (target_dir / "test.txt").read_text() == "test content"
+            # Verify the file was copied
+            assert (target_dir / "test.txt").exists()
+            assert (target_dir / "test.txt").read_text() == "test content"
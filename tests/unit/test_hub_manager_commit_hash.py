@@ -1,7 +1,6 @@
 """Test hub manager commit hash resolution functionality."""
 
 import subprocess
-import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -9,87 +8,82 @@ import pytest
 
 from interaxions.hub.hub_manager import HubManager
 
+_GIT_ERR = subprocess.CalledProcessError(128, ["git", "rev-parse"], stderr="fatal error")
 
-class TestGetLocalCommitHash:
-    """Test _get_local_commit_hash method."""
 
-    def test_get_local_commit_hash_success(self):
-        """Test that _get_local_commit_hash returns correct commit hash."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir = Path(tmpdir)
+def _git_exists(self):
+    """Stand-in for Path.exists that reports only .git paths as present."""
+    return str(self).endswith(".git")
 
-            # Create a fake git repo directory
-            repo_path = tmpdir / "test-repo"
-            repo_path.mkdir()
 
-            # Create cache directory
-            cache_dir = tmpdir / "cache"
-            hub = HubManager(cache_dir=cache_dir)
+class TestGetLocalCommitHash:
+    """Test _get_local_commit_hash method."""
 
-            # Mock subprocess.run for git rev-parse
-            mock_result = MagicMock()
-            mock_result.stdout = "abc12345\n"
+    def test_get_local_commit_hash_success(self, hub_env):
+        """Test that _get_local_commit_hash returns correct commit hash."""
+        hub, repo_path = hub_env.hub, hub_env.repo_path
 
-            # Mock the .git directory check
-            def mock_exists(self):
-                return str(self).endswith(".git")
+        # Mock subprocess.run for git rev-parse
+        mock_result = MagicMock()
+        mock_result.stdout = "abc12345\n"
 
-            with patch("subprocess.run", return_value=mock_result) as mock_run, \
-                 patch.object(Path, "exists", mock_exists):
+        with patch("subprocess.run", return_value=mock_result) as mock_run, \
+             patch.object(Path, "exists", _git_exists):
 
-                # Execute the method
-                commit_hash = hub._get_local_commit_hash(repo_path)
+            # Execute the method
+            commit_hash = hub._get_local_commit_hash(repo_path)
 
-                # Verify correct commit hash returned
-                assert commit_hash == "abc12345"
+            # Verify correct commit hash returned
+            assert commit_hash == "abc12345"
 
-                # Verify git rev-parse was called correctly
-                mock_run.assert_called_once_with(
-                    ["git", "rev-parse", "--short=8", "HEAD"],
-                    cwd=repo_path,
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
+            # Verify git rev-parse was called correctly
+            mock_run.assert_called_once_with(
+                ["git", "rev-parse", "--short=8", "HEAD"],
+                cwd=repo_path,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
 
-    def test_get_local_commit_hash_non_git_repo(self):
+    def test_get_local_commit_hash_non_git_repo(self, hub_env):
         """Test that non-git directories return 'HEAD' as fallback."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir = Path(tmpdir)
+        # Execute the method (no .git directory exists)
+        commit_hash = hub_env.hub._get_local_commit_hash(hub_env.repo_path)
 
-            # Create a non-git directory
-            repo_path = tmpdir / "test-dir"
-            repo_path.mkdir()
+        # Should return 'HEAD' as fallback
+        assert commit_hash == "HEAD"
 
-            cache_dir = tmpdir / "cache"
-            hub = HubManager(cache_dir=cache_dir)
+    def test_get_local_commit_hash_git_error(self, hub_env):
+        """Test error handling when git command fails."""
+        hub, repo_path = hub_env.hub, hub_env.repo_path
 
-            # Execute the method (no .git directory exists)
-            commit_hash = hub._get_local_commit_hash(repo_path)
+        # Mock subprocess.run to raise CalledProcessError
+        with patch("subprocess.run", side_effect=_GIT_ERR), \
+             patch.object(Path, "exists", _git_exists):
 
-            # Should return 'HEAD' as fallback
+            # Should return 'HEAD' as fallback on error
+            commit_hash = hub._get_local_commit_hash(repo_path)
             assert commit_hash == "HEAD"
 
-    def test_get_local_commit_hash_git_error(self):
-        """Test error handling when git command fails."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir = Path(tmpdir)
 
-            repo_path = tmpdir / "test-repo"
-            repo_path.mkdir()
+class TestResolveRevision:
+    """Test resolve_revision method."""
 
-            cache_dir = tmpdir / "cache"
-            hub = HubManager(cache_dir=cache_dir)
+    def test_pinned_revision_returned_unchanged(self, tmp_path):
+        """Pinned revisions are returned without touching git."""
+        hub = HubManager(cache_dir=tmp_path / "cache")
 
-            # Mock the .git directory check
-            def mock_exists(self):
-                return str(self).endswith(".git")
+        with patch.object(hub, "_resolve_repo_path") as mock_resolve:
+            assert hub.resolve_revision("ix-hub/swe-agent", "v1.0.0") == "v1.0.0"
+            mock_resolve.assert_not_called()
 
-            # Mock subprocess.run to raise CalledProcessError
-            error = subprocess.CalledProcessError(128, ["git", "rev-parse"], stderr="fatal error")
-            with patch("subprocess.run", side_effect=error), \
-                 patch.object(Path, "exists", mock_exists):
+    def test_none_resolves_to_local_head(self, tmp_path):
+        """revision=None resolves to the local HEAD commit hash."""
+        hub = HubManager(cache_dir=tmp_path / "cache")
+        repo_path = tmp_path / "test-repo"
 
-                # Should return 'HEAD' as fallback on error
-                commit_hash = hub._get_local_commit_hash(repo_path)
-                assert commit_hash == "HEAD"
+        with patch.object(hub, "_resolve_repo_path", return_value=repo_path) as mock_resolve, \
+             patch.object(hub, "_get_local_commit_hash", return_value="abc12345") as mock_hash:
+            assert hub.resolve_revision("ix-hub/swe-agent") == "abc12345"
+            mock_resolve.assert_called_once_with("ix-hub/swe-agent", None, None)
+            mock_hash.assert_called_once_with(repo_path)
@@ -0,0 +1,35 @@
+"""Test hub manager Git URL construction."""
+
+import pytest
+
+from interaxions.hub.hub_manager import HubManager
+
+
+class TestToGitUrl:
+    """Test _to_git_url method."""
+
+    @pytest.mark.parametrize(
+        "endpoint, public_url, auth_url",
+        [
+            pytest.param(None, "https://github.com/org/repo.git", "https://u:t@github.com/org/repo.git", id="unset"),
+            pytest.param("https://gitlab.company.com", "https://gitlab.company.com/org/repo.git", "https://u:t@gitlab.company.com/org/repo.git", id="https"),
+            pytest.param("http://git.local:3000", "http://git.local:3000/org/repo.git", "http://u:t@git.local:3000/org/repo.git", id="http"),
+            pytest.param("https://gitlab.company.com/", "https://gitlab.company.com/org/repo.git", "https://u:t@gitlab.company.com/org/repo.git", id="trailing-slash"),
+            pytest.param("gitlab.company.com", "gitlab.company.com/org/repo.git", "https://u:t@gitlab.company.com/org/repo.git", id="bare-host"),
+            pytest.param("HTTPS://GitHub.com", "HTTPS://GitHub.com/org/repo.git", "https://u:t@GitHub.com/org/repo.git", id="uppercase-scheme"),
+        ],
+    )
+    def test_to_git_url(self, tmp_path, monkeypatch, endpoint, public_url, auth_url):
+        """Test URL construction for each IX_ENDPOINT form, with and without credentials."""
+        if endpoint is None:
+            monkeypatch.delenv("IX_ENDPOINT", raising=False)
+        else:
+            monkeypatch.setenv("IX_ENDPOINT", endpoint)
+        hub = HubManager(cache_dir=tmp_path / "cache")
+
+        assert hub._to_git_url("org/repo") == public_url
+        assert hub._to_git_url("org/repo", "u", "t") == auth_url
+
+        # Credentials are only embedded when both username and token are given
+        assert hub._to_git_url("org/repo", "u", None) == public_url
+        assert hub._to_git_url("org/repo", None, "t") == public_url
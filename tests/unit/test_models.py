@@ -2,11 +2,13 @@
 Unit tests for model schemas (OpenAIModel, AnthropicModel, LiteLLMModel, Model Union).
 """
 
+import json
+
 import pytest
 from pydantic import ValidationError
 
 from interaxions.schemas import LiteLLMModel
-from interaxions.schemas.models import AnthropicModel, Model, OpenAIModel
+from interaxions.schemas.models import AnthropicModel, OpenAIModel, dump_model, validate_model
 
 
 # ============================================================================
@@ -76,11 +78,11 @@ class TestAnthropicModel:
         assert model.api_key == "sk-ant-test"
         assert model.base_url == "https://api.anthropic.com"
 
-    def test_temperature_range(self):
-        # Valid range for Anthropic: 0.0 – 1.0
-        for temp in [0.0, 0.5, 1.0]:
-            model = AnthropicModel(model="claude-3-5-sonnet-latest", api_key="sk-test", temperature=temp)
-            assert model.temperature == temp
+    # Valid range for Anthropic: 0.0 – 1.0
+    @pytest.mark.parametrize("temp", [0.0, 0.5, 1.0])
+    def test_temperature_range(self, temp):
+        model = AnthropicModel(model="claude-3-5-sonnet-latest", api_key="sk-test", temperature=temp)
+        assert model.temperature == temp
 
     def test_temperature_out_of_range(self):
         with pytest.raises(ValidationError):
@@ -180,16 +182,16 @@ class TestLiteLLMModel:
                 extra_field="not_allowed",
             )
 
-    def test_temperature_range(self):
-        for temp in [0.0, 0.5, 1.0]:
-            model = LiteLLMModel(
-                provider="openai",
-                model="gpt-4o",
-                base_url="https://api.openai.com/v1",
-                api_key="sk-test",
-                temperature=temp,
-            )
-            assert model.temperature == temp
+    @pytest.mark.parametrize("temp", [0.0, 0.5, 1.0])
+    def test_temperature_range(self, temp):
+        model = LiteLLMModel(
+            provider="openai",
+            model="gpt-4o",
+            base_url="https://api.openai.com/v1",
+            api_key="sk-test",
+            temperature=temp,
+        )
+        assert model.temperature == temp
 
     def test_temperature_out_of_range(self):
         with pytest.raises(ValidationError):
@@ -222,10 +224,10 @@ class TestLiteLLMModel:
             base_url="https://api.openai.com/v1",
             api_key="sk-test",
         )
-        json_str = model.model_dump_json()
-        assert "gpt-4o" in json_str
-        restored = LiteLLMModel.model_validate_json(json_str)
-        assert restored.model == "gpt-4o"
+        data = json.loads(model.model_dump_json())
+        assert data["model"] == "gpt-4o"
+        restored = LiteLLMModel.model_validate(data)
+        assert restored == model
 
 
 # ============================================================================
@@ -239,17 +241,13 @@ class TestModelUnion:
 
     def test_openai_discriminated(self):
         data = {"type": "openai", "model": "gpt-4o", "api_key": "sk-test"}
-        from pydantic import TypeAdapter
-        ta = TypeAdapter(Model)
-        model = ta.validate_python(data)
+        model = validate_model(data)
         assert isinstance(model, OpenAIModel)
         assert model.type == "openai"
 
     def test_anthropic_discriminated(self):
         data = {"type": "anthropic", "model": "claude-3-5-sonnet-latest", "api_key": "sk-ant-test"}
-        from pydantic import TypeAdapter
-        ta = TypeAdapter(Model)
-        model = ta.validate_python(data)
+        model = validate_model(data)
         assert isinstance(model, AnthropicModel)
         assert model.type == "anthropic"
 
@@ -261,17 +259,42 @@ class TestModelUnion:
             "base_url": "https://api.openai.com/v1",
             "api_key": "sk-test",
         }
-        from pydantic import TypeAdapter
-        ta = TypeAdapter(Model)
-        model = ta.validate_python(data)
+        model = validate_model(data)
         assert isinstance(model, LiteLLMModel)
 
+    @pytest.mark.parametrize(
+        "data",
+        [
+            pytest.param({
+                "type": "openai",
+                "model": "gpt-4o",
+                "api_key": "sk-test"
+            }, id="openai"),
+            pytest.param({
+                "type": "anthropic",
+                "model": "claude-3-5-sonnet-latest",
+                "api_key": "sk-ant-test"
+            }, id="anthropic"),
+            pytest.param({
+                "type": "litellm",
+                "provider": "openai",
+                "model": "gpt-4o",
+                "base_url": "https://api.openai.com/v1",
+                "api_key": "sk-test"
+            }, id="litellm"),
+        ],
+    )
+    def test_completion_kwargs_default_and_none(self, data):
+        """completion_kwargs defaults to a fresh dict per instance and still accepts an explicit null."""
+        first, second = validate_model(data), validate_model(data)
+        assert first.completion_kwargs == {}
+        assert first.completion_kwargs is not second.completion_kwargs
+        assert validate_model({**data, "completion_kwargs": None}).completion_kwargs is None
+
     def test_unknown_type_raises(self):
         data = {"type": "unknown", "model": "x", "api_key": "k"}
-        from pydantic import TypeAdapter
-        ta = TypeAdapter(Model)
         with pytest.raises(ValidationError):
-            ta.validate_python(data)
+            validate_model(data)
 
     def test_serialization_preserves_type_field(self):
         model = LiteLLMModel(
@@ -282,3 +305,9 @@ class TestModelUnion:
         )
         data = model.model_dump()
         assert data["type"] == "litellm"
+
+    def test_dump_model_roundtrip(self):
+        model = AnthropicModel(model="claude-3-5-sonnet-latest", api_key="sk-ant-test")
+        data = dump_model(model)
+        assert data["type"] == "anthropic"
+        assert validate_model(data) == model
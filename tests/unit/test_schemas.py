@@ -5,6 +5,8 @@ Covers: ScaffoldConfig, EnvironmentConfig, WorkflowConfig, RuntimeConfig,
         Environment (task data carrier), and XJob.
 """
 
+import re
+
 import pytest
 from pydantic import ValidationError
 
@@ -66,7 +68,7 @@ class TestScaffoldConfig:
     def test_missing_required_field(self):
         with pytest.raises(ValidationError) as exc_info:
             ScaffoldConfig()
-        assert "repo_name_or_path" in str(exc_info.value)
+        assert [err["loc"] for err in exc_info.value.errors()] == [("repo_name_or_path",)]
 
     def test_serialization_roundtrip(self):
         original = ScaffoldConfig(
@@ -85,6 +87,11 @@ class TestScaffoldConfig:
         assert restored.repo_name_or_path == cfg.repo_name_or_path
         assert restored.params == cfg.params
 
+    def test_is_frozen(self):
+        cfg = ScaffoldConfig(repo_name_or_path="ix-hub/agent")
+        with pytest.raises(ValidationError):
+            cfg.revision = "v2.0.0"
+
 
 # ============================================================================
 # EnvironmentConfig
@@ -122,7 +129,7 @@ class TestEnvironmentConfig:
     def test_missing_required_fields(self):
         with pytest.raises(ValidationError) as exc_info:
             EnvironmentConfig(repo_name_or_path="ix-hub/swe-bench")
-        assert "id" in str(exc_info.value)
+        assert [err["loc"] for err in exc_info.value.errors()] == [("id",)]
 
     def test_missing_repo_name(self):
         with pytest.raises(ValidationError):
@@ -248,7 +255,7 @@ class TestRuntimeConfig:
     def test_missing_required_namespace(self):
         with pytest.raises(ValidationError) as exc_info:
             RuntimeConfig()
-        assert "namespace" in str(exc_info.value)
+        assert [err["loc"] for err in exc_info.value.errors()] == [("namespace",)]
 
     def test_extra_params_flexible(self):
         rt = RuntimeConfig(
@@ -275,6 +282,11 @@ class TestRuntimeConfig:
         assert restored.namespace == rt.namespace
         assert restored.service_account == rt.service_account
 
+    def test_extra_fields_forbidden(self):
+        """Unknown runtime settings belong in extra_params."""
+        with pytest.raises(ValidationError):
+            RuntimeConfig(namespace="ns", node_selector={"gpu": "true"})
+
 
 # ============================================================================
 # Environment (data carrier from schemas.task)
@@ -343,7 +355,6 @@ class TestEnvironment:
 
     def test_subclass_can_extend(self):
         """Workflow-specific environment models can inherit Environment and add fields."""
-        from pydantic import BaseModel
 
         class SWEEnvironment(Environment):
             fix_hack: bool = False
@@ -384,9 +395,7 @@ class TestXJob:
 
     def test_job_id_auto_generated(self, sample_workflow_config, sample_runtime_config):
         job = XJob(workflow=sample_workflow_config, runtime=sample_runtime_config)
-        assert job.job_id is not None
-        assert job.job_id.startswith("job-")
-        assert len(job.job_id) > 10
+        assert re.fullmatch(r"job-[0-9a-f]{32}", job.job_id)
 
     def test_job_id_unique_each_time(self, sample_workflow_config, sample_runtime_config):
         job1 = XJob(workflow=sample_workflow_config, runtime=sample_runtime_config)
@@ -401,6 +410,40 @@ class TestXJob:
         )
         assert job.job_id == "custom-job-abc123"
 
+    def test_explicit_none_job_id_auto_generated(self, sample_workflow_config, sample_runtime_config):
+        job = XJob(job_id=None, workflow=sample_workflow_config, runtime=sample_runtime_config)
+        assert job.job_id.startswith("job-")
+
+    def test_generated_job_id_survives_exclude_unset(self, sample_workflow_config, sample_runtime_config):
+        """A generated job_id counts as set, so sparse dumps keep the job's identity."""
+        job = XJob(workflow=sample_workflow_config, runtime=sample_runtime_config)
+        assert "job_id" in job.model_fields_set
+        restored = XJob.model_validate_json(job.model_dump_json(exclude_unset=True))
+        assert restored.job_id == job.job_id
+
+    def test_is_frozen(self, sample_job):
+        with pytest.raises(ValidationError):
+            sample_job.name = "renamed"
+
+    def test_model_copy_update(self, sample_job):
+        """Frozen jobs are changed by copying with updates."""
+        renamed = sample_job.model_copy(update={"name": "renamed"})
+        assert renamed.name == "renamed"
+        assert renamed.job_id == sample_job.job_id
+        assert sample_job.name == "test-swe-bench-job"
+
+    def test_extra_fields_forbidden(self, sample_workflow_config, sample_runtime_config):
+        with pytest.raises(ValidationError):
+            XJob(workflow=sample_workflow_config, runtime=sample_runtime_config, priority="high")
+
+    def test_new_fast(self, sample_workflow_config, sample_runtime_config):
+        """new_fast skips validation but still fills in job_id and defaults."""
+        job = XJob.new_fast(name="fast", workflow=sample_workflow_config, runtime=sample_runtime_config)
+        assert re.fullmatch(r"job-[0-9a-f]{32}", job.job_id)
+        assert job.name == "fast"
+        assert job.tags is None
+        assert job == XJob(job_id=job.job_id, name="fast", workflow=sample_workflow_config, runtime=sample_runtime_config)
+
     def test_full_metadata(self, sample_job):
         assert sample_job.name == "test-swe-bench-job"
         assert sample_job.description == "A test SWE-bench job for unit testing"
@@ -412,12 +455,12 @@ class TestXJob:
     def test_missing_required_workflow(self, sample_runtime_config):
         with pytest.raises(ValidationError) as exc_info:
             XJob(runtime=sample_runtime_config)
-        assert "workflow" in str(exc_info.value)
+        assert [err["loc"] for err in exc_info.value.errors()] == [("workflow",)]
 
     def test_missing_required_runtime(self, sample_workflow_config):
         with pytest.raises(ValidationError) as exc_info:
             XJob(workflow=sample_workflow_config)
-        assert "runtime" in str(exc_info.value)
+        assert [err["loc"] for err in exc_info.value.errors()] == [("runtime",)]
 
     def test_workflow_params_contains_components(self, sample_job):
         """All component configs (scaffold, env, model) live in workflow.params."""
@@ -429,9 +472,8 @@ class TestXJob:
         assert params["environment"]["id"] == "astropy__astropy-12907"
         assert params["model"]["type"] == "litellm"
 
-    def test_json_serialization_roundtrip(self, sample_job):
-        json_str = sample_job.model_dump_json()
-        restored = XJob.model_validate_json(json_str)
+    def test_json_serialization_roundtrip(self, sample_job, sample_job_json):
+        restored = XJob.model_validate_json(sample_job_json)
         assert restored.name == sample_job.name
         assert restored.workflow.repo_name_or_path == sample_job.workflow.repo_name_or_path
         assert restored.runtime.namespace == sample_job.runtime.namespace
@@ -444,31 +486,23 @@ class TestXJob:
         assert job.runtime.namespace == "default"
         assert job.workflow.params["environment"]["id"] == "django__django-12345"
 
-    def test_tags_list(self, sample_workflow_config, sample_runtime_config):
-        job = XJob(
-            workflow=sample_workflow_config,
-            runtime=sample_runtime_config,
-            tags=["alpha", "beta", "gamma"],
-        )
-        assert len(job.tags) == 3
-        assert "alpha" in job.tags
-
-    def test_labels_dict(self, sample_workflow_config, sample_runtime_config):
-        job = XJob(
-            workflow=sample_workflow_config,
-            runtime=sample_runtime_config,
-            labels={"env": "staging", "version": "2"},
-        )
-        assert job.labels["env"] == "staging"
-        assert job.labels["version"] == "2"
-
-    def test_extra_params_optional(self, sample_workflow_config, sample_runtime_config):
-        job = XJob(
-            workflow=sample_workflow_config,
-            runtime=sample_runtime_config,
-            extra_params={"debug": True, "dry_run": False},
-        )
-        assert job.extra_params["debug"] is True
+    @pytest.mark.parametrize(
+        "field, value",
+        [
+            pytest.param("tags", ["alpha", "beta", "gamma"], id="tags"),
+            pytest.param("labels", {
+                "env": "staging",
+                "version": "2"
+            }, id="labels"),
+            pytest.param("extra_params", {
+                "debug": True,
+                "dry_run": False
+            }, id="extra_params"),
+        ],
+    )
+    def test_optional_metadata(self, sample_workflow_config, sample_runtime_config, field, value):
+        job = XJob(workflow=sample_workflow_config, runtime=sample_runtime_config, **{field: value})
+        assert getattr(job, field) == value
 
     def test_persistence_to_file(self, sample_job, tmp_path):
         """XJob can be saved as JSON and loaded back."""